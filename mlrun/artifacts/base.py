@@ -11,26 +11,117 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import collections
+import concurrent.futures
+import copy
 import hashlib
+import io
 import os
+import threading
+import time
 import warnings
 
-import yaml
+import orjson
+import requests
 
 import mlrun
 import mlrun.errors
 
 from ..datastore import get_store_uri, is_store_uri, store_manager
 from ..model import ModelObj
-from ..utils import StorePrefix, calculate_local_file_hash, generate_artifact_uri
+from ..utils import (
+    HashingReader,
+    StorePrefix,
+    calculate_local_file_hash,
+    create_exponential_backoff,
+    format_hash,
+    generate_artifact_uri,
+    logger,
+    new_hash_object,
+    resolve_hash_algorithm,
+)
 
 calc_hash = True
 
 
-class ArtifactMetadata(ModelObj):
+# legacy artifact attributes (ArtifactLegacy structure) and the section (metadata/spec) which holds them now
+_legacy_artifact_attributes = {
+    "tag": "metadata",
+    "key": "metadata",
+    "labels": "metadata",
+    "iter": "metadata",
+    "tree": "metadata",
+    "project": "metadata",
+    "hash": "metadata",
+    "inline": "spec",
+    "src_path": "spec",
+    "target_path": "spec",
+    "producer": "spec",
+    "format": "spec",
+    "viewer": "spec",
+    "size": "spec",
+    "db_key": "spec",
+    "sources": "spec",
+    "extra_data": "spec",
+}
+
+
+# legacy attributes which were already warned about, each deprecation warning is emitted once per process
+_warned_legacy_attributes = set()
+
+
+def _warn_legacy_attribute(name, section):
+    if name in _warned_legacy_attributes:
+        return
+    _warned_legacy_attributes.add(name)
+    warnings.warn(
+        f"This is a property of the {section}, use artifact.{section}.{name} instead. "
+        "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
+        # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
+        PendingDeprecationWarning,
+    )
+
+
+def _get_store_url(artifact, uri_parts):
+    """return the store url of an artifact from its (project, db_key, tag, iter) parts
+
+    the url of the last call is kept on the artifact, it's reused while the parts don't change
+    """
+    cached = getattr(artifact, "_store_url_cache", None)
+    if cached and cached[0] == uri_parts:
+        return cached[1]
+    store_url = get_store_uri(artifact._store_prefix, generate_artifact_uri(*uri_parts))
+    artifact._store_url_cache = (uri_parts, store_url)
+    return store_url
+
+
+class _AllFieldsMixin:
+    """keep the full field tuple (_dict_fields + _extra_fields) of each class, instead of concatenating per call"""
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # subclasses may override the field lists
+        cls._all_fields = tuple(cls._dict_fields + cls._extra_fields)
+
+
+class ArtifactMetadata(_AllFieldsMixin, ModelObj):
     _dict_fields = ["key", "project", "iter", "tree", "description", "hash", "tag"]
     _extra_fields = ["updated", "labels"]
 
+    __slots__ = (
+        "key",
+        "project",
+        "iter",
+        "tree",
+        "description",
+        "hash",
+        "labels",
+        "updated",
+        "tag",
+    )
+
     def __init__(
         self,
         key=None,
@@ -56,17 +147,17 @@ class ArtifactMetadata(ModelObj):
 
     def to_dict(self, fields=None, exclude=None):
         """return long dict form of the artifact"""
-        return super().to_dict(self._dict_fields + self._extra_fields, exclude=exclude)
+        return super().to_dict(self._all_fields, exclude=exclude)
 
     @classmethod
     def from_dict(cls, struct=None, fields=None, deprecated_fields: dict = None):
-        fields = fields or cls._dict_fields + cls._extra_fields
+        fields = fields or cls._all_fields
         return super().from_dict(
             struct, fields=fields, deprecated_fields=deprecated_fields
         )
 
 
-class ArtifactSpec(ModelObj):
+class ArtifactSpec(_AllFieldsMixin, ModelObj):
     _dict_fields = [
         "src_path",
         "target_path",
@@ -80,6 +171,23 @@ class ArtifactSpec(ModelObj):
 
     _extra_fields = ["annotations", "producer", "sources", "license", "encoding"]
 
+    __slots__ = (
+        "src_path",
+        "target_path",
+        "viewer",
+        "_is_inline",
+        "format",
+        "size",
+        "db_key",
+        "extra_data",
+        "_body",
+        "encoding",
+        "annotations",
+        "sources",
+        "producer",
+        "license",
+    )
+
     def __init__(
         self,
         src_path=None,
@@ -113,11 +221,11 @@ class ArtifactSpec(ModelObj):
 
     def to_dict(self, fields=None, exclude=None):
         """return long dict form of the artifact"""
-        return super().to_dict(self._dict_fields + self._extra_fields, exclude=exclude)
+        return super().to_dict(self._all_fields, exclude=exclude)
 
     @classmethod
     def from_dict(cls, struct=None, fields=None, deprecated_fields: dict = None):
-        fields = fields or cls._dict_fields + cls._extra_fields
+        fields = fields or cls._all_fields
         return super().from_dict(
             struct, fields=fields, deprecated_fields=deprecated_fields
         )
@@ -141,6 +249,7 @@ class ArtifactSpec(ModelObj):
 
 class ArtifactStatus(ModelObj):
     _dict_fields = ["state"]
+    __slots__ = ("state",)
 
     def __init__(self):
         self.state = "created"
@@ -195,7 +304,7 @@ class Artifact(ModelObj):
 
     @metadata.setter
     def metadata(self, metadata):
-        self._metadata = self._verify_dict(metadata, "metadata", ArtifactMetadata)
+        self._metadata = self._verify_model_obj(metadata, "metadata", ArtifactMetadata)
 
     @property
     def spec(self) -> ArtifactSpec:
@@ -203,7 +312,7 @@ class Artifact(ModelObj):
 
     @spec.setter
     def spec(self, spec):
-        self._spec = self._verify_dict(spec, "spec", ArtifactSpec)
+        self._spec = self._verify_model_obj(spec, "spec", ArtifactSpec)
 
     @property
     def status(self) -> ArtifactStatus:
@@ -211,7 +320,16 @@ class Artifact(ModelObj):
 
     @status.setter
     def status(self, status):
-        self._status = self._verify_dict(status, "status", ArtifactStatus)
+        self._status = self._verify_model_obj(status, "status", ArtifactStatus)
+
+    @staticmethod
+    def _verify_model_obj(param, name, new_type):
+        # fast path for the common cases (defaults and ready objects), only dicts need the full verification
+        if param is None:
+            return new_type()
+        if isinstance(param, new_type):
+            return param
+        return Artifact._verify_dict(param, name, new_type)
 
     def before_log(self):
         pass
@@ -243,18 +361,23 @@ class Artifact(ModelObj):
     def get_store_url(self, with_tag=True, project=None):
         """get the artifact uri (store://..) with optional parameters"""
         tag = self.metadata.tree if with_tag else None
-        uri = generate_artifact_uri(
-            project or self.metadata.project, self.spec.db_key, tag, self.metadata.iter
+        uri_parts = (
+            project or self.metadata.project,
+            self.spec.db_key,
+            tag,
+            self.metadata.iter,
         )
-        return get_store_uri(self._store_prefix, uri)
+        return _get_store_url(self, uri_parts)
 
     def base_dict(self):
         """return short dict form of the artifact"""
         struct = {"kind": self.kind}
-        for field in ["metadata", "spec", "status"]:
-            val = getattr(self, field, None)
-            if val:
-                struct[field] = val.base_dict()
+        if self._metadata:
+            struct["metadata"] = self._metadata.base_dict()
+        if self._spec:
+            struct["spec"] = self._spec.base_dict()
+        if self._status:
+            struct["status"] = self._status.base_dict()
         return struct
 
     def upload(self):
@@ -268,427 +391,35 @@ class Artifact(ModelObj):
                 self._upload_file(src_path)
 
     def _upload_body(self, body, target=None):
-        if calc_hash:
-            self.metadata.hash = blob_hash(body)
         self.spec.size = len(body)
-        store_manager.object(url=target or self.spec.target_path).put(body)
+        data_item = store_manager.object(url=target or self.spec.target_path)
+        body_hash = _put_body(data_item, body)
+        if body_hash:
+            self.metadata.hash = body_hash
 
     def _upload_file(self, src, target=None):
-        if calc_hash:
-            self.metadata.hash = calculate_local_file_hash(src)
-        self.spec.size = os.stat(src).st_size
-        store_manager.object(url=target or self.spec.target_path).upload(src)
-
-    # Following properties are for backwards compatibility with the ArtifactLegacy class. They should be
-    # removed once we only work with the new Artifact structure.
-
-    @property
-    def inline(self):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.inline instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.spec.inline
-
-    @inline.setter
-    def inline(self, body):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.inline instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.spec.inline = body
-
-    @property
-    def tag(self):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the metadata, use artifact.metadata.tag instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.metadata.tag
-
-    @tag.setter
-    def tag(self, tag):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the metadata, use artifact.metadata.tag instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.metadata.tag = tag
-
-    @property
-    def key(self):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the metadata, use artifact.metadata.key instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.metadata.key
-
-    @key.setter
-    def key(self, key):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the metadata, use artifact.metadata.key instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.metadata.key = key
-
-    @property
-    def src_path(self):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.src_path instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.spec.src_path
-
-    @src_path.setter
-    def src_path(self, src_path):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.src_path instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.spec.src_path = src_path
-
-    @property
-    def target_path(self):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.target_path instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.spec.target_path
-
-    @target_path.setter
-    def target_path(self, target_path):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.target_path instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.spec.target_path = target_path
-
-    @property
-    def producer(self):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.producer instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.spec.producer
-
-    @producer.setter
-    def producer(self, producer):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.producer instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.spec.producer = producer
-
-    @property
-    def format(self):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.format instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.spec.format
-
-    @format.setter
-    def format(self, format):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.format instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.spec.format = format
-
-    @property
-    def viewer(self):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.viewer instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.spec.viewer
-
-    @viewer.setter
-    def viewer(self, viewer):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.viewer instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.spec.viewer = viewer
-
-    @property
-    def size(self):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.size instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.spec.size
-
-    @size.setter
-    def size(self, size):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.size instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.spec.size = size
+        data_item = store_manager.object(url=target or self.spec.target_path)
+        file_hash, self.spec.size = _upload_local_file(data_item, src)
+        if file_hash:
+            self.metadata.hash = file_hash
 
-    @property
-    def db_key(self):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.db_key instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.spec.db_key
-
-    @db_key.setter
-    def db_key(self, db_key):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.db_key instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.spec.db_key = db_key
 
-    @property
-    def sources(self):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.sources instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.spec.sources
-
-    @sources.setter
-    def sources(self, sources):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.sources instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.spec.sources = sources
+def _legacy_artifact_property(name, section):
+    def getter(self):
+        _warn_legacy_attribute(name, section)
+        return getattr(getattr(self, section), name)
 
-    @property
-    def extra_data(self):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.extra_data instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.spec.extra_data
-
-    @extra_data.setter
-    def extra_data(self, extra_data):
-        """This is a property of the spec, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.spec.extra_data instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.spec.extra_data = extra_data
+    def setter(self, value):
+        _warn_legacy_attribute(name, section)
+        setattr(getattr(self, section), name, value)
 
-    @property
-    def labels(self):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.metadata.labels instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.metadata.labels
-
-    @labels.setter
-    def labels(self, labels):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the metadata, use artifact.metadata.labels instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.metadata.labels = labels
+    return property(getter, setter)
 
-    @property
-    def iter(self):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.metadata.iter instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.metadata.iter
-
-    @iter.setter
-    def iter(self, iter):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the metadata, use artifact.metadata.iter instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.metadata.iter = iter
 
-    @property
-    def tree(self):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.metadata.tree instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.metadata.tree
-
-    @tree.setter
-    def tree(self, tree):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the metadata, use artifact.metadata.tree instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.metadata.tree = tree
-
-    @property
-    def project(self):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.metadata.project instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.metadata.project
-
-    @project.setter
-    def project(self, project):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the metadata, use artifact.metadata.project instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.metadata.project = project
-
-    @property
-    def hash(self):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the spec, use artifact.metadata.hash instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        return self.metadata.hash
-
-    @hash.setter
-    def hash(self, hash):
-        """This is a property of the metadata, look there for documentation
-        leaving here for backwards compatibility with users code that used ArtifactLegacy"""
-        warnings.warn(
-            "This is a property of the metadata, use artifact.metadata.hash instead"
-            "This will be deprecated in 1.3.0, and will be removed in 1.5.0",
-            # TODO: In 1.3.0 do changes in examples & demos In 1.5.0 remove
-            PendingDeprecationWarning,
-        )
-        self.metadata.hash = hash
+# Following attributes are for backwards compatibility with the ArtifactLegacy class. They should be
+# removed once we only work with the new Artifact structure.
+for _name, _section in _legacy_artifact_attributes.items():
+    setattr(Artifact, _name, _legacy_artifact_property(_name, _section))
 
 
 class DirArtifactSpec(ArtifactSpec):
@@ -719,23 +450,20 @@ class DirArtifact(Artifact):
 
     @spec.setter
     def spec(self, spec):
-        self._spec = self._verify_dict(spec, "spec", DirArtifactSpec)
+        self._spec = self._verify_model_obj(spec, "spec", DirArtifactSpec)
 
     @property
     def is_dir(self):
         return True
 
-    def upload(self):
-        if not self.spec.src_path:
-            raise ValueError("local/source path not specified")
+    def upload(self, max_workers: int = None):
+        """internal, upload the directory files to the target store
 
-        files = os.listdir(self.spec.src_path)
-        for f in files:
-            file_path = os.path.join(self.spec.src_path, f)
-            if not os.path.isfile(file_path):
-                raise ValueError(f"file {file_path} not found, cant upload")
-            target = os.path.join(self.spec.target_path, f)
-            store_manager.object(url=target).upload(file_path)
+        :param max_workers: max number of concurrent uploads, default to artifacts.upload_concurrency config
+        """
+        _upload_files(
+            _dir_uploads(self.spec.src_path, self.spec.target_path), max_workers
+        )
 
 
 class LinkArtifactSpec(ArtifactSpec):
@@ -787,10 +515,10 @@ class LinkArtifact(Artifact):
 
     @spec.setter
     def spec(self, spec):
-        self._spec = self._verify_dict(spec, "spec", LinkArtifactSpec)
+        self._spec = self._verify_model_obj(spec, "spec", LinkArtifactSpec)
 
 
-class LegacyArtifact(ModelObj):
+class LegacyArtifact(_AllFieldsMixin, ModelObj):
 
     _dict_fields = [
         "key",
@@ -809,6 +537,14 @@ class LegacyArtifact(ModelObj):
         "extra_data",
         "tag",
     ]
+    _extra_fields = [
+        "updated",
+        "labels",
+        "annotations",
+        "producer",
+        "sources",
+        "project",
+    ]
     kind = ""
     _store_prefix = StorePrefix.Artifact
 
@@ -847,6 +583,8 @@ class LegacyArtifact(ModelObj):
         self.tag = None  # temp store of the tag
 
     def before_log(self):
+        if not self.extra_data:
+            return
         for key, item in self.extra_data.items():
             if hasattr(item, "target_path"):
                 self.extra_data[key] = item.target_path
@@ -889,10 +627,8 @@ class LegacyArtifact(ModelObj):
     def get_store_url(self, with_tag=True, project=None):
         """get the artifact uri (store://..) with optional parameters"""
         tag = self.tree if with_tag else None
-        uri = generate_artifact_uri(
-            project or self.project, self.db_key, tag, self.iter
-        )
-        return get_store_uri(self._store_prefix, uri)
+        uri_parts = (project or self.project, self.db_key, tag, self.iter)
+        return _get_store_url(self, uri_parts)
 
     def base_dict(self):
         """return short dict form of the artifact"""
@@ -900,21 +636,11 @@ class LegacyArtifact(ModelObj):
 
     def to_dict(self, fields=None):
         """return long dict form of the artifact"""
-        return super().to_dict(
-            self._dict_fields
-            + ["updated", "labels", "annotations", "producer", "sources", "project"]
-        )
+        return super().to_dict(self._all_fields)
 
     @classmethod
     def from_dict(cls, struct=None, fields=None):
-        fields = fields or cls._dict_fields + [
-            "updated",
-            "labels",
-            "annotations",
-            "producer",
-            "sources",
-            "project",
-        ]
+        fields = fields or cls._all_fields
         return super().from_dict(struct, fields=fields)
 
     def upload(self):
@@ -928,16 +654,17 @@ class LegacyArtifact(ModelObj):
                 self._upload_file(src_path)
 
     def _upload_body(self, body, target=None):
-        if calc_hash:
-            self.hash = blob_hash(body)
         self.size = len(body)
-        store_manager.object(url=target or self.target_path).put(body)
+        data_item = store_manager.object(url=target or self.target_path)
+        body_hash = _put_body(data_item, body)
+        if body_hash:
+            self.hash = body_hash
 
     def _upload_file(self, src, target=None):
-        if calc_hash:
-            self.hash = calculate_local_file_hash(src)
-        self.size = os.stat(src).st_size
-        store_manager.object(url=target or self.target_path).upload(src)
+        data_item = store_manager.object(url=target or self.target_path)
+        file_hash, self.size = _upload_local_file(data_item, src)
+        if file_hash:
+            self.hash = file_hash
 
     def artifact_kind(self):
         return self.kind
@@ -960,17 +687,12 @@ class LegacyDirArtifact(LegacyArtifact):
     def is_dir(self):
         return True
 
-    def upload(self):
-        if not self.src_path:
-            raise ValueError("local/source path not specified")
+    def upload(self, max_workers: int = None):
+        """internal, upload the directory files to the target store
 
-        files = os.listdir(self.src_path)
-        for f in files:
-            file_path = os.path.join(self.src_path, f)
-            if not os.path.isfile(file_path):
-                raise ValueError(f"file {file_path} not found, cant upload")
-            target = os.path.join(self.target_path, f)
-            store_manager.object(url=target).upload(file_path)
+        :param max_workers: max number of concurrent uploads, default to artifacts.upload_concurrency config
+        """
+        _upload_files(_dir_uploads(self.src_path, self.target_path), max_workers)
 
 
 class LegacyLinkArtifact(LegacyArtifact):
@@ -997,12 +719,143 @@ class LegacyLinkArtifact(LegacyArtifact):
         self.link_tree = link_tree
 
 
-def blob_hash(data):
+def blob_hash(data, algorithm=None):
     if isinstance(data, str):
         data = data.encode()
-    h = hashlib.sha1()
+    algorithm = resolve_hash_algorithm(algorithm)
+    h = new_hash_object(algorithm)
     h.update(data)
-    return h.hexdigest()
+    return format_hash(algorithm, h.hexdigest())
+
+
+def _is_transient_upload_error(exc):
+    """connection errors, timeouts and 5xx/429 http responses, also when wrapped by another error"""
+    while exc is not None:
+        if isinstance(
+            exc,
+            (
+                ConnectionError,
+                TimeoutError,
+                requests.ConnectionError,
+                requests.Timeout,
+            ),
+        ):
+            return True
+        if isinstance(exc, requests.HTTPError) and exc.response is not None:
+            status_code = exc.response.status_code
+            if status_code and (status_code >= 500 or status_code == 429):
+                return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def _retry_upload(upload_function, *args):
+    """run an upload function, retry it with exponential backoff on transient errors
+
+    the upload function must be safe to re-run (e.g. reopen the file it uploads)
+    """
+    max_attempts = int(mlrun.mlconf.artifacts.upload_max_attempts)
+    backoff = create_exponential_backoff(base=2, max_value=60)
+    attempt = 1
+    while True:
+        try:
+            return upload_function(*args)
+        except Exception as exc:
+            if attempt >= max_attempts or not _is_transient_upload_error(exc):
+                raise
+            interval = next(backoff)
+            logger.warning(
+                "Upload failed with a transient error, retrying",
+                attempt=attempt,
+                max_attempts=max_attempts,
+                interval=interval,
+                exc=str(exc),
+            )
+            time.sleep(interval)
+            attempt += 1
+
+
+def _put_body(data_item, body):
+    """store an artifact body, return its hash (None when calc_hash is disabled)"""
+    if (
+        calc_hash
+        and isinstance(body, bytes)
+        and data_item.store.supports_fileobj_upload()
+    ):
+
+        def _upload():
+            # stream the body and hash it while it is being uploaded, instead of in a separate pass
+            reader = HashingReader(io.BytesIO(body))
+            data_item.upload_fileobj(reader, size=len(body))
+            return reader.hexdigest()
+
+        return _retry_upload(_upload)
+
+    body_hash = blob_hash(body) if calc_hash else None
+    _retry_upload(data_item.put, body)
+    return body_hash
+
+
+def _upload_local_file(data_item, src):
+    """upload a local file, return its hash (None when calc_hash is disabled) and size"""
+    if calc_hash and data_item.store.supports_fileobj_upload():
+
+        def _upload():
+            # hash the file while it is being uploaded, instead of reading it twice
+            with open(src, "rb") as fp:
+                size = os.fstat(fp.fileno()).st_size
+                reader = HashingReader(fp)
+                data_item.upload_fileobj(reader, size=size)
+            return reader.hexdigest(), size
+
+        return _retry_upload(_upload)
+
+    file_hash = calculate_local_file_hash(src) if calc_hash else None
+    size = os.stat(src).st_size
+    _retry_upload(data_item.upload, src)
+    return file_hash, size
+
+
+def _dir_uploads(src_path, target_path):
+    """return the (source, target) list for uploading the files of a local directory"""
+    if not src_path:
+        raise ValueError("local/source path not specified")
+
+    # scandir entries hold the file type from the directory listing, no stat() per file
+    with os.scandir(src_path) as entries:
+        entries = sorted(entries, key=lambda entry: entry.name)
+    uploads = []
+    for entry in entries:
+        if not entry.is_file():
+            raise ValueError(f"file {entry.path} not found, cant upload")
+        uploads.append((entry.path, os.path.join(target_path, entry.name)))
+    return uploads
+
+
+def _upload_files(uploads, max_workers=None):
+    """upload a list of (source, target) concurrently, raise the first upload error
+
+    the source is either a local file path or a bytes body
+    """
+
+    def _upload(upload):
+        source, data_item = upload
+        if isinstance(source, bytes):
+            _retry_upload(data_item.put, source)
+        else:
+            _retry_upload(data_item.upload, source)
+
+    # resolve the data items (and create their stores) on the calling thread, the workers only upload
+    uploads = [(source, store_manager.object(url=target)) for source, target in uploads]
+    if len(uploads) <= 1:
+        # no need for a thread pool (most artifacts have no or a single extra data item)
+        for upload in uploads:
+            _upload(upload)
+        return
+
+    max_workers = max_workers or int(mlrun.mlconf.artifacts.upload_concurrency)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_upload, uploads))
 
 
 def upload_extra_data(
@@ -1010,38 +863,77 @@ def upload_extra_data(
     extra_data: dict,
     prefix="",
     update_spec=False,
+    max_workers: int = None,
 ):
     if not extra_data:
         return
     target_path = artifact_spec.target_path
+    src_dir = artifact_spec.src_path
+    uploads = []
+    # the spec is updated only once all the items were uploaded
+    spec_updates = {}
     for key, item in extra_data.items():
 
         if isinstance(item, bytes):
             target = os.path.join(target_path, key)
-            store_manager.object(url=target).put(item)
-            artifact_spec.extra_data[prefix + key] = target
+            uploads.append((item, target))
+            spec_updates[prefix + key] = target
             continue
 
         if not (item.startswith("/") or "://" in item):
-            src_path = (
-                os.path.join(artifact_spec.src_path, item)
-                if artifact_spec.src_path
-                else item
-            )
+            src_path = os.path.join(src_dir, item) if src_dir else item
             if not os.path.isfile(src_path):
                 raise ValueError(f"extra data file {src_path} not found")
-            target = os.path.join(target_path, item)
-            store_manager.object(url=target).upload(src_path)
+            uploads.append((src_path, os.path.join(target_path, item)))
 
         if update_spec:
-            artifact_spec.extra_data[prefix + key] = item
+            spec_updates[prefix + key] = item
+
+    _upload_files(uploads, max_workers)
+    artifact_spec.extra_data.update(spec_updates)
+
+
+# parsed artifact yamls, keyed by a digest of the yaml content (so large payloads aren't kept in memory)
+_artifact_yaml_cache = collections.OrderedDict()
+_artifact_yaml_cache_size = 32
+_artifact_yaml_cache_lock = threading.Lock()
+
+
+def _parse_artifact_yaml(data):
+    """parse an artifact yaml, cached by the yaml content (the same files are often loaded repeatedly)"""
+    import yaml
+
+    key = hashlib.blake2b(
+        data.encode() if isinstance(data, str) else data, digest_size=16
+    ).digest()
+    with _artifact_yaml_cache_lock:
+        if key in _artifact_yaml_cache:
+            _artifact_yaml_cache.move_to_end(key)
+            return _artifact_yaml_cache[key]
+
+    # artifact yamls are written with yaml.safe_dump, use the libyaml (C) loader when it's available
+    parsed = yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    with _artifact_yaml_cache_lock:
+        _artifact_yaml_cache[key] = parsed
+        if len(_artifact_yaml_cache) > _artifact_yaml_cache_size:
+            _artifact_yaml_cache.popitem(last=False)
+    return parsed
+
+
+def _clear_artifact_yaml_cache():
+    with _artifact_yaml_cache_lock:
+        _artifact_yaml_cache.clear()
+
+
+# same reset hook as functools.lru_cache
+_parse_artifact_yaml.cache_clear = _clear_artifact_yaml_cache
 
 
 def get_artifact_meta(artifact):
     """return artifact object, and list of extra data items
 
 
-    :param artifact:   artifact path (store://..) or DataItem
+    :param artifact:   artifact path (store://.., or a .yaml/.json artifact file) or DataItem
 
     :returns: artifact object, extra data dict
 
@@ -1054,9 +946,14 @@ def get_artifact_meta(artifact):
 
     elif artifact.lower().endswith(".yaml"):
         data = store_manager.object(url=artifact).get()
-        spec = yaml.load(data, Loader=yaml.FullLoader)
+        # the artifact objects may be modified by the caller, don't share the cached dict
+        spec = copy.deepcopy(_parse_artifact_yaml(data))
         artifact_spec = mlrun.artifacts.dict_to_artifact(spec)
 
+    elif artifact.lower().endswith(".json"):
+        data = store_manager.object(url=artifact).get()
+        artifact_spec = mlrun.artifacts.dict_to_artifact(orjson.loads(data))
+
     else:
         raise ValueError(f"cant resolve artifact file for {artifact}")
 
@@ -87,7 +87,7 @@ class TableArtifact(Artifact):
 
     @spec.setter
     def spec(self, spec):
-        self._spec = self._verify_dict(spec, "spec", TableArtifactSpec)
+        self._spec = self._verify_model_obj(spec, "spec", TableArtifactSpec)
 
     def get_body(self):
         if not self._is_df:
@@ -168,7 +168,7 @@ class DatasetArtifact(Artifact):
 
     @spec.setter
     def spec(self, spec):
-        self._spec = self._verify_dict(spec, "spec", DatasetArtifactSpec)
+        self._spec = self._verify_model_obj(spec, "spec", DatasetArtifactSpec)
 
     def upload(self):
         suffix = pathlib.Path(self.spec.target_path).suffix
@@ -155,7 +155,7 @@ class ModelArtifact(Artifact):
 
     @spec.setter
     def spec(self, spec):
-        self._spec = self._verify_dict(spec, "spec", ModelArtifactSpec)
+        self._spec = self._verify_model_obj(spec, "spec", ModelArtifactSpec)
 
     @property
     def inputs(self) -> List[Feature]:
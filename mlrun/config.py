@@ -106,6 +106,18 @@ default_config = {
     "v3io_api": "http://v3io-webapi:8081",
     "v3io_framesd": "http://framesd:8080",
     "datastore": {"async_source_mode": "disabled"},
+    "artifacts": {
+        # hash algorithm used for artifact content hashes, one of: blake2b, blake3, xxh3, sha256, sha1
+        # blake3 and xxh3 (non cryptographic) require the optional blake3 / xxhash packages (mlrun[blake3] /
+        # mlrun[xxhash]), blake2b is used when the package isn't installed
+        # sha1 hashes are stored without an algorithm prefix, for backwards compatibility
+        "hash_algorithm": "blake2b",
+        # max number of files uploaded concurrently (e.g. by dir artifacts)
+        "upload_concurrency": 16,
+        # max number of attempts per upload, uploads are retried (with exponential backoff) on
+        # connection errors, timeouts and 5xx/429 responses
+        "upload_max_attempts": 3,
+    },
     # default node selector to be applied to all functions - json string base64 encoded format
     "default_function_node_selector": "e30=",
     # default priority class to be applied to functions running on k8s cluster
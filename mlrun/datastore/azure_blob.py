@@ -88,6 +88,17 @@ class AzureBlobStore(DataStore):
             remote_path = self._convert_key_to_remote_path(key)
             self._filesystem.put_file(src_path, remote_path, overwrite=True)
 
+    def supports_fileobj_upload(self):
+        return self.bsc is not None
+
+    def upload_fileobj(self, key, fileobj, size=None):
+        with self.bsc.get_blob_client(
+            container=self.endpoint, blob=key[1:]
+        ) as blob_client:
+            # without a length (the file object isn't seekable) the sdk uploads in staged blocks,
+            # with it smaller contents are uploaded with a single put blob request
+            blob_client.upload_blob(fileobj, length=size, overwrite=True)
+
     def get(self, key, size=None, offset=0):
         if self.bsc:
             with self.bsc.get_blob_client(
@@ -134,6 +134,17 @@ class DataStore:
     def upload(self, key, src_path):
         pass
 
+    def supports_fileobj_upload(self):
+        """whether the store can upload directly from a (non seekable) file object"""
+        return False
+
+    def upload_fileobj(self, key, fileobj, size=None):
+        """upload the content of a binary file object, reading it sequentially (once)
+
+        size (bytes), when known, lets stores which need the content length upload it in a single request
+        """
+        raise ValueError("data store doesnt support upload from file object")
+
     def as_df(
         self,
         url,
@@ -337,6 +348,14 @@ class DataItem:
         """
         self._store.upload(self._path, src_path)
 
+    def upload_fileobj(self, fileobj, size=None):
+        """upload the content of a binary file object (when supported by the store)
+
+        :param fileobj: binary file object to read from and upload, it is read sequentially
+        :param size:    content size in bytes, when known
+        """
+        self._store.upload_fileobj(self._path, fileobj, size)
+
     def stat(self):
         """return FileStats class (size, modified, content_type)"""
         return self._store.stat(self._path)
@@ -52,6 +52,12 @@ class InMemoryStore(DataStore):
         with open(src_path, "rb") as fp:
             self._items[key] = fp.read()
 
+    def supports_fileobj_upload(self):
+        return True
+
+    def upload_fileobj(self, key, fileobj, size=None):
+        self._items[key] = fileobj.read()
+
     def stat(self, key):
         return FileStats(size=len(self._get_item(key)), modified=0)
 
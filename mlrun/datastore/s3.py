@@ -16,11 +16,18 @@ import time
 
 import boto3
 import fsspec
+from boto3.s3.transfer import TransferConfig
 
 import mlrun.errors
 
 from .base import DataStore, FileStats, get_range
 
+# multipart upload settings for files above the threshold, the part concurrency is kept lower than the boto3
+# default (10) since artifact files are already uploaded concurrently
+_transfer_config = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024, max_concurrency=4
+)
+
 
 class S3Store(DataStore):
     def __init__(self, parent, schema, name, endpoint=""):
@@ -82,8 +89,19 @@ class S3Store(DataStore):
         return storage_options
 
     def upload(self, key, src_path):
-        self.s3.Object(self.endpoint, self._join(key)[1:]).put(
-            Body=open(src_path, "rb")
+        # uploads use the low level client, which (unlike boto3 resources) is thread safe,
+        # artifact files may be uploaded concurrently from worker threads.
+        # the transfer manager uploads large files in concurrent multipart parts
+        self.s3.meta.client.upload_file(
+            src_path, self.endpoint, self._join(key)[1:], Config=_transfer_config
+        )
+
+    def supports_fileobj_upload(self):
+        return True
+
+    def upload_fileobj(self, key, fileobj, size=None):
+        self.s3.meta.client.upload_fileobj(
+            fileobj, self.endpoint, self._join(key)[1:], Config=_transfer_config
         )
 
     def get(self, key, size=None, offset=0):
@@ -93,7 +111,9 @@ class S3Store(DataStore):
         return obj.get()["Body"].read()
 
     def put(self, key, data, append=False):
-        self.s3.Object(self.endpoint, self._join(key)[1:]).put(Body=data)
+        self.s3.meta.client.put_object(
+            Bucket=self.endpoint, Key=self._join(key)[1:], Body=data
+        )
 
     def stat(self, key):
         obj = self.s3.Object(self.endpoint, self._join(key)[1:])
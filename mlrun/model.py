@@ -32,6 +32,8 @@ RUN_ID_PLACE_HOLDER = "{run_id}"  # IMPORTANT: shouldn't be changed.
 
 class ModelObj:
     _dict_fields = []
+    # allows subclasses to define __slots__, subclasses without them keep a __dict__
+    __slots__ = ()
 
     @staticmethod
     def _verify_list(param, name):
@@ -13,6 +13,7 @@
 # limitations under the License.
 #
 # this file is based on the code from kubeflow pipelines git
+import functools
 import os
 
 from mlrun.config import config
@@ -21,6 +22,23 @@ from mlrun.errors import MLRunInvalidArgumentError
 from .iguazio import mount_v3io
 
 
+def _resolve_env_pvc_mount():
+    """return the (pvc name, mount path) configured in the MLRUN_PVC_MOUNT env var, None if not set"""
+    return _parse_pvc_mount(os.environ.get("MLRUN_PVC_MOUNT"))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_pvc_mount(mount):
+    if mount is None:
+        return None
+    items = mount.split(":")
+    if len(items) != 2:
+        raise MLRunInvalidArgumentError(
+            "MLRUN_PVC_MOUNT should include <pvc-name>:<mount-path>"
+        )
+    return items[0], items[1]
+
+
 def mount_pvc(pvc_name=None, volume_name="pipeline", volume_mount_path="/mnt/pipeline"):
     """
     Modifier function to apply to a Container Op to simplify volume, volume mount addition and
@@ -31,30 +49,26 @@ def mount_pvc(pvc_name=None, volume_name="pipeline", volume_mount_path="/mnt/pip
         train = train_op(...)
         train.apply(mount_pvc('claim-name', 'pipeline', '/mnt/pipeline'))
     """
-    if "MLRUN_PVC_MOUNT" in os.environ:
-        mount = os.environ.get("MLRUN_PVC_MOUNT")
-        items = mount.split(":")
-        if len(items) != 2:
-            raise MLRunInvalidArgumentError(
-                "MLRUN_PVC_MOUNT should include <pvc-name>:<mount-path>"
-            )
-        pvc_name = items[0]
-        volume_mount_path = items[1]
+    env_pvc_mount = _resolve_env_pvc_mount()
+    if env_pvc_mount:
+        pvc_name, volume_mount_path = env_pvc_mount
 
     if not pvc_name:
         raise MLRunInvalidArgumentError(
             "No PVC name: use the pvc_name parameter or configure the MLRUN_PVC_MOUNT environment variable"
         )
 
-    def _mount_pvc(task):
-        from kubernetes import client as k8s_client
+    from kubernetes import client as k8s_client
 
-        local_pvc = k8s_client.V1PersistentVolumeClaimVolumeSource(claim_name=pvc_name)
-        return task.add_volume(
-            k8s_client.V1Volume(name=volume_name, persistent_volume_claim=local_pvc)
-        ).add_volume_mount(
-            k8s_client.V1VolumeMount(mount_path=volume_mount_path, name=volume_name)
-        )
+    # the volume objects are the same for every task the modifier is applied to
+    local_pvc = k8s_client.V1PersistentVolumeClaimVolumeSource(claim_name=pvc_name)
+    volume = k8s_client.V1Volume(name=volume_name, persistent_volume_claim=local_pvc)
+    volume_mount = k8s_client.V1VolumeMount(
+        mount_path=volume_mount_path, name=volume_name
+    )
+
+    def _mount_pvc(task):
+        return task.add_volume(volume).add_volume_mount(volume_mount)
 
     return _mount_pvc
 
@@ -74,7 +88,7 @@ def auto_mount(pvc_name="", volume_mount_path="", volume_name=None):
             volume_mount_path=volume_mount_path,
             volume_name=volume_name or "shared-persistency",
         )
-    if "MLRUN_PVC_MOUNT" in os.environ:
+    if _resolve_env_pvc_mount():
         return mount_pvc(
             volume_name=volume_name or "shared-persistency",
         )
@@ -103,15 +117,14 @@ def mount_secret(secret_name, mount_path, volume_name="secret", items=None):
                          present.
     """
 
-    def _mount_secret(task):
-        from kubernetes import client as k8s_client
+    from kubernetes import client as k8s_client
 
-        vol = k8s_client.V1SecretVolumeSource(secret_name=secret_name, items=items)
-        return task.add_volume(
-            k8s_client.V1Volume(name=volume_name, secret=vol)
-        ).add_volume_mount(
-            k8s_client.V1VolumeMount(mount_path=mount_path, name=volume_name)
-        )
+    vol = k8s_client.V1SecretVolumeSource(secret_name=secret_name, items=items)
+    volume = k8s_client.V1Volume(name=volume_name, secret=vol)
+    volume_mount = k8s_client.V1VolumeMount(mount_path=mount_path, name=volume_name)
+
+    def _mount_secret(task):
+        return task.add_volume(volume).add_volume_mount(volume_mount)
 
     return _mount_secret
 
@@ -131,15 +144,14 @@ def mount_configmap(configmap_name, mount_path, volume_name="configmap", items=N
                             present.
     """
 
-    def _mount_configmap(task):
-        from kubernetes import client as k8s_client
+    from kubernetes import client as k8s_client
 
-        vol = k8s_client.V1ConfigMapVolumeSource(name=configmap_name, items=items)
-        return task.add_volume(
-            k8s_client.V1Volume(name=volume_name, config_map=vol)
-        ).add_volume_mount(
-            k8s_client.V1VolumeMount(mount_path=mount_path, name=volume_name)
-        )
+    vol = k8s_client.V1ConfigMapVolumeSource(name=configmap_name, items=items)
+    volume = k8s_client.V1Volume(name=volume_name, config_map=vol)
+    volume_mount = k8s_client.V1VolumeMount(mount_path=mount_path, name=volume_name)
+
+    def _mount_configmap(task):
+        return task.add_volume(volume).add_volume_mount(volume_mount)
 
     return _mount_configmap
 
@@ -152,16 +164,15 @@ def mount_hostpath(host_path, mount_path, volume_name="hostpath"):
     :param volume_name:  unique volume name
     """
 
+    from kubernetes import client as k8s_client
+
+    volume = k8s_client.V1Volume(
+        name=volume_name,
+        host_path=k8s_client.V1HostPathVolumeSource(path=host_path, type=""),
+    )
+    volume_mount = k8s_client.V1VolumeMount(mount_path=mount_path, name=volume_name)
+
     def _mount_hostpath(task):
-        from kubernetes import client as k8s_client
-
-        return task.add_volume(
-            k8s_client.V1Volume(
-                name=volume_name,
-                host_path=k8s_client.V1HostPathVolumeSource(path=host_path, type=""),
-            )
-        ).add_volume_mount(
-            k8s_client.V1VolumeMount(mount_path=mount_path, name=volume_name)
-        )
+        return task.add_volume(volume).add_volume_mount(volume_mount)
 
     return _mount_hostpath
@@ -15,14 +15,17 @@
 import enum
 import hashlib
 import inspect
+import io
 import json
+import mmap
 import re
 import sys
+import threading
 import time
 import typing
 from datetime import datetime, timezone
 from importlib import import_module
-from os import environ, path
+from os import environ, fstat, path
 from types import ModuleType
 from typing import Any, List, Optional, Tuple
 
@@ -1254,14 +1257,144 @@ def as_list(element: Any) -> List[Any]:
     return element if isinstance(element, list) else [element]
 
 
-def calculate_local_file_hash(filename):
-    h = hashlib.sha1()
-    b = bytearray(128 * 1024)
-    mv = memoryview(b)
+def _new_blake3():
+    import blake3
+
+    return blake3.blake3()
+
+
+def _new_xxh3():
+    import xxhash
+
+    return xxhash.xxh3_128()
+
+
+_hash_algorithms = {
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "blake2b": lambda: hashlib.blake2b(digest_size=32),
+    "blake3": _new_blake3,
+    "xxh3": _new_xxh3,
+}
+# algorithms which are provided by optional packages (algorithm -> package)
+_optional_hash_packages = {"blake3": "blake3", "xxh3": "xxhash"}
+_installed_hash_packages = {}
+
+
+def _is_hash_package_installed(package):
+    if package not in _installed_hash_packages:
+        try:
+            import_module(package)
+        except ImportError:
+            _installed_hash_packages[package] = False
+        else:
+            _installed_hash_packages[package] = True
+    return _installed_hash_packages[package]
+
+
+def resolve_hash_algorithm(algorithm: str = None) -> str:
+    """return the hash algorithm to use, the configured artifacts hash algorithm by default
+
+    blake3 and xxh3 are provided by the optional blake3 and xxhash packages, blake2b is used
+    when the package isn't installed
+    """
+    algorithm = algorithm or config.artifacts.hash_algorithm
+    package = _optional_hash_packages.get(algorithm)
+    if package and not _is_hash_package_installed(package):
+        return "blake2b"
+    return algorithm
+
+
+def new_hash_object(algorithm: str = None):
+    """return a new hash object for the given (or the configured artifacts) hash algorithm"""
+    algorithm = resolve_hash_algorithm(algorithm)
+    if algorithm not in _hash_algorithms:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"unsupported hash algorithm {algorithm}, "
+            f"must be one of {list(_hash_algorithms.keys())}"
+        )
+    return _hash_algorithms[algorithm]()
+
+
+def format_hash(algorithm: str, hexdigest: str) -> str:
+    """format a hash digest as stored in the artifact metadata (<algorithm>:<hexdigest>)
+
+    sha1 digests are kept without a prefix, as in hashes which were stored by older versions
+    """
+    if algorithm == "sha1":
+        return hexdigest
+    return f"{algorithm}:{hexdigest}"
+
+
+# files from this size are hashed through a memory map instead of being read into a buffer
+_mmap_hash_min_size = 16 * 1024
+# per thread read buffer for hashing smaller files (files are hashed concurrently by upload threads)
+_hash_buffers = threading.local()
+
+
+def _get_hash_buffer():
+    buffer = getattr(_hash_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _hash_buffers.buffer = memoryview(bytearray(_mmap_hash_min_size))
+    return buffer
+
+
+def calculate_local_file_hash(filename, algorithm: str = None):
+    """calculate the content hash of a local file (formatted as stored in the artifact metadata)
+
+    the data is passed to the hash object in large blocks (a single memory mapped block for larger
+    files), so sha1/sha256 run in hashlib's OpenSSL implementation without returning to python,
+    which uses the CPU's SHA extensions (x86 SHA-NI, ARMv8 crypto) when the OpenSSL build supports them
+    """
+    algorithm = resolve_hash_algorithm(algorithm)
     with open(filename, "rb", buffering=0) as f:
-        for n in iter(lambda: f.readinto(mv), 0):
-            h.update(mv[:n])
-    return h.hexdigest()
+        mapped = None
+        if fstat(f.fileno()).st_size >= _mmap_hash_min_size:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # some file systems and special files can't be memory mapped, they are read instead
+                pass
+
+        h = new_hash_object(algorithm)
+        if mapped is not None:
+            with mapped:
+                h.update(mapped)
+        else:
+            mv = _get_hash_buffer()
+            for n in iter(lambda: f.readinto(mv), 0):
+                h.update(mv[:n])
+    return format_hash(algorithm, h.hexdigest())
+
+
+class HashingReader(io.RawIOBase):
+    """read-only (non seekable) file object wrapper which hashes the data as it is being read
+
+    used to calculate the content hash during an upload, without a separate pass over the data
+    """
+
+    def __init__(self, fileobj, algorithm: str = None):
+        self._fileobj = fileobj
+        self._algorithm = resolve_hash_algorithm(algorithm)
+        self._hash = new_hash_object(self._algorithm)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = self._fileobj.readinto(buffer)
+        if n:
+            self._hash.update(memoryview(buffer)[:n])
+        return n
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        self._hash.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        """return the hash of the data read so far (formatted as stored in the artifact metadata)"""
+        return format_hash(self._algorithm, self._hash.hexdigest())
 
 
 def fill_artifact_path_template(artifact_path, project):
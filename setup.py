@@ -97,6 +97,8 @@ extras_require = {
     "plotly": ["plotly~=5.4"],
     "google-cloud-storage": ["gcsfs~=2021.8.1"],
     "google-cloud-bigquery": ["google-cloud-bigquery~=3.0"],
+    "blake3": ["blake3~=0.3.1"],
+    "xxhash": ["xxhash~=3.0"],
 }
 extras_require["complete"] = sorted(
     {
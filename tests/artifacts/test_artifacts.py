@@ -1,3 +1,10 @@
+import hashlib
+import threading
+import unittest.mock
+import warnings
+
+import pytest
+
 import mlrun
 import mlrun.artifacts
 from mlrun.artifacts.manager import extend_artifact_path
@@ -48,6 +55,40 @@ def test_artifact_uri():
     assert prefix == StorePrefix.Model, "illegal artifact uri"
 
 
+# (artifact class, metadata accessor, spec accessor), legacy artifacts hold all the fields themselves
+artifact_classes = pytest.mark.parametrize(
+    "artifact_class, metadata, spec",
+    [
+        (mlrun.artifacts.Artifact, lambda a: a.metadata, lambda a: a.spec),
+        (mlrun.artifacts.base.LegacyArtifact, lambda a: a, lambda a: a),
+    ],
+)
+dir_artifact_classes = pytest.mark.parametrize(
+    "artifact_class, spec",
+    [
+        (mlrun.artifacts.base.DirArtifact, lambda a: a.spec),
+        (mlrun.artifacts.base.LegacyDirArtifact, lambda a: a),
+    ],
+)
+
+
+@artifact_classes
+def test_artifact_uri_follows_changes(artifact_class, metadata, spec):
+    artifact = artifact_class("data", body="abc")
+    metadata(artifact).project = "proj"
+    spec(artifact).db_key = "data"
+    assert artifact.uri == "store://artifacts/proj/data"
+    assert artifact.uri is artifact.uri
+
+    metadata(artifact).tree = "1234"
+    metadata(artifact).iter = 2
+    assert artifact.uri == "store://artifacts/proj/data#2:1234"
+    assert artifact.get_store_url(with_tag=False) == "store://artifacts/proj/data#2"
+    assert artifact.get_store_url(project="other") == (
+        "store://artifacts/other/data#2:1234"
+    )
+
+
 def test_extend_artifact_path():
     tests = ["", "./", "abc", "+/", "+/x"]
     expected = ["", "./", "abc", "", "x"]
@@ -56,3 +97,201 @@ def test_extend_artifact_path():
     expected = ["yz", "./", "abc", "yz/", "yz/x"]
     for i, test in enumerate(tests):
         assert extend_artifact_path(test, "yz") == expected[i]
+
+
+@artifact_classes
+def test_upload_body_calculates_hash(tmp_path, artifact_class, metadata, spec):
+    body = b"some artifact body" * 1000
+    for target_path in ["memory://artifact-body", str(tmp_path / "artifact-body")]:
+        artifact = artifact_class("data", body=body, target_path=target_path)
+        artifact.upload()
+        assert metadata(artifact).hash == mlrun.artifacts.base.blob_hash(body)
+        assert spec(artifact).size == len(body)
+        assert mlrun.get_dataitem(target_path).get() == body
+    mlrun.datastore.get_in_memory_items().pop("artifact-body")
+
+
+@artifact_classes
+def test_upload_file_calculates_hash(tmp_path, artifact_class, metadata, spec):
+    data = b"some artifact file" * 1000
+    src_path = tmp_path / "src-file"
+    src_path.write_bytes(data)
+    for target_path in ["memory://artifact-file", str(tmp_path / "artifact-file")]:
+        artifact = artifact_class("data", target_path=target_path)
+        spec(artifact).src_path = str(src_path)
+        artifact.upload()
+        assert metadata(artifact).hash == mlrun.utils.calculate_local_file_hash(
+            str(src_path)
+        )
+        assert spec(artifact).size == len(data)
+        assert mlrun.get_dataitem(target_path).get() == data
+    mlrun.datastore.get_in_memory_items().pop("artifact-file")
+
+
+@dir_artifact_classes
+def test_dir_artifact_upload(tmp_path, artifact_class, spec):
+    src_path = tmp_path / "src"
+    src_path.mkdir()
+    files = {f"file{i}.txt": f"content {i}".encode() for i in range(20)}
+    for name, data in files.items():
+        (src_path / name).write_bytes(data)
+
+    target_path = tmp_path / "target"
+    artifact = artifact_class("dir", target_path=str(target_path))
+    spec(artifact).src_path = str(src_path)
+    artifact.upload(max_workers=2)
+    for name, data in files.items():
+        assert (target_path / name).read_bytes() == data
+
+    (src_path / "subdir").mkdir()
+    with pytest.raises(ValueError):
+        artifact.upload()
+
+
+def test_upload_files_creates_stores_on_calling_thread(tmp_path, monkeypatch):
+    src_path = tmp_path / "src"
+    src_path.mkdir()
+    files = {f"file{i}.txt": f"content {i}".encode() for i in range(10)}
+    for name, data in files.items():
+        (src_path / name).write_bytes(data)
+
+    # start from an empty store cache, so the target store is created by the upload
+    store_manager = mlrun.artifacts.base.store_manager
+    monkeypatch.setattr(store_manager, "_stores", {})
+    store_threads = []
+    get_or_create_store = store_manager.get_or_create_store
+
+    def _get_or_create_store(url):
+        store_threads.append(threading.current_thread())
+        return get_or_create_store(url)
+
+    monkeypatch.setattr(store_manager, "get_or_create_store", _get_or_create_store)
+
+    target_path = tmp_path / "target"
+    artifact = mlrun.artifacts.base.LegacyDirArtifact(
+        "dir", target_path=f"file://{target_path}"
+    )
+    artifact.src_path = str(src_path)
+    artifact.upload(max_workers=4)
+
+    assert len(store_threads) == len(files)
+    assert set(store_threads) == {threading.current_thread()}
+    assert len(store_manager._stores) == 1
+    for name, data in files.items():
+        assert (target_path / name).read_bytes() == data
+
+
+def test_upload_extra_data(tmp_path):
+    src_path = tmp_path / "src"
+    src_path.mkdir()
+    (src_path / "file.txt").write_bytes(b"file content")
+
+    target_path = tmp_path / "target"
+    artifact = mlrun.artifacts.Artifact("data", target_path=str(target_path))
+    artifact.spec.src_path = str(src_path)
+    extra_data = {"body": b"body content", "file": "file.txt"}
+    mlrun.artifacts.base.upload_extra_data(
+        artifact.spec, extra_data, prefix="extra_", update_spec=True
+    )
+    assert (target_path / "body").read_bytes() == b"body content"
+    assert (target_path / "file.txt").read_bytes() == b"file content"
+    assert artifact.spec.extra_data == {
+        "extra_body": str(target_path / "body"),
+        "extra_file": "file.txt",
+    }
+
+    # the spec isn't updated when an item can't be uploaded
+    with pytest.raises(ValueError):
+        mlrun.artifacts.base.upload_extra_data(
+            artifact.spec, {"other": b"other content", "file": "missing.txt"}
+        )
+    assert "other" not in artifact.spec.extra_data
+
+
+def test_legacy_attributes_warn_once():
+    artifact = mlrun.artifacts.Artifact("data", body="abc")
+    mlrun.artifacts.base._warned_legacy_attributes.clear()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        artifact.tag = "v1"
+        for _ in range(3):
+            assert artifact.tag == "v1"
+            assert artifact.key == "data"
+    assert artifact.metadata.tag == "v1"
+    assert len(caught) == 2
+    assert all(
+        issubclass(warning.category, PendingDeprecationWarning) for warning in caught
+    )
+
+
+def test_upload_retries_transient_errors():
+    calls = []
+
+    def _upload(error, failures):
+        calls.append(error)
+        if len(calls) <= failures:
+            raise error
+        return "uploaded"
+
+    def _wrapped_connection_error():
+        try:
+            raise ConnectionError("connection reset")
+        except ConnectionError as exc:
+            raise OSError(f"error: cannot connect: {exc}")
+
+    with unittest.mock.patch("time.sleep") as sleep:
+        assert (
+            mlrun.artifacts.base._retry_upload(
+                _upload, ConnectionError("connection reset"), 2
+            )
+            == "uploaded"
+        )
+        assert len(calls) == 3
+        assert [call.args[0] for call in sleep.call_args_list] == [2, 4]
+
+        # wrapped transient errors are retried, until the max attempts
+        calls.clear()
+        try:
+            _wrapped_connection_error()
+        except OSError as exc:
+            wrapped_error = exc
+        with pytest.raises(OSError):
+            mlrun.artifacts.base._retry_upload(_upload, wrapped_error, 5)
+        assert len(calls) == mlrun.mlconf.artifacts.upload_max_attempts
+
+        # other errors are raised right away
+        calls.clear()
+        with pytest.raises(FileNotFoundError):
+            mlrun.artifacts.base._retry_upload(
+                _upload, FileNotFoundError("no such file"), 1
+            )
+        assert len(calls) == 1
+
+
+def test_get_artifact_meta_from_yaml(tmp_path):
+    artifact = mlrun.artifacts.Artifact("data", target_path="/data/file.txt")
+    artifact.metadata.labels = {"owner": "someone"}
+    artifact_path = tmp_path / "artifact.yaml"
+    artifact_path.write_text(artifact.to_yaml())
+
+    mlrun.artifacts.base._parse_artifact_yaml.cache_clear()
+    first, _ = mlrun.artifacts.get_artifact_meta(str(artifact_path))
+    first.metadata.labels["owner"] = "someone-else"
+    second, _ = mlrun.artifacts.get_artifact_meta(str(artifact_path))
+    assert second.metadata.labels == {"owner": "someone"}
+    assert second.spec.target_path == "/data/file.txt"
+    # only the parsed dict is cached, keyed by a digest of the yaml content
+    assert list(mlrun.artifacts.base._artifact_yaml_cache.keys()) == [
+        hashlib.blake2b(artifact_path.read_bytes(), digest_size=16).digest()
+    ]
+
+
+def test_get_artifact_meta_from_json(tmp_path):
+    artifact = mlrun.artifacts.Artifact("data", target_path="/data/file.txt")
+    artifact.metadata.labels = {"owner": "someone"}
+    artifact_path = tmp_path / "artifact.json"
+    artifact_path.write_text(artifact.to_json())
+
+    loaded, extra_data = mlrun.artifacts.get_artifact_meta(str(artifact_path))
+    assert loaded.to_dict() == artifact.to_dict()
+    assert extra_data == {}
@@ -1,4 +1,5 @@
 import deepdiff
+import pytest
 
 import mlrun
 import mlrun.errors
@@ -66,3 +67,38 @@ def test_mount_hostpath():
         )
         == {}
     )
+
+
+def test_mount_pvc_from_env(monkeypatch):
+    expected_volume = {
+        "name": "shared-persistency",
+        "persistentVolumeClaim": {"claimName": "my-pvc"},
+    }
+    expected_volume_mount = {"mountPath": "/mnt/data", "name": "shared-persistency"}
+
+    monkeypatch.setenv("MLRUN_PVC_MOUNT", "my-pvc:/mnt/data")
+    function = mlrun.new_function(
+        "function-name", "function-project", kind=mlrun.runtimes.RuntimeKinds.job
+    )
+    function.apply(mlrun.platforms.auto_mount())
+
+    assert (
+        deepdiff.DeepDiff(
+            [expected_volume],
+            function.spec.volumes,
+            ignore_order=True,
+        )
+        == {}
+    )
+    assert (
+        deepdiff.DeepDiff(
+            [expected_volume_mount],
+            function.spec.volume_mounts,
+            ignore_order=True,
+        )
+        == {}
+    )
+
+    monkeypatch.setenv("MLRUN_PVC_MOUNT", "my-pvc")
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        mlrun.platforms.mount_pvc()
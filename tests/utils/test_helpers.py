@@ -1,3 +1,4 @@
+import hashlib
 import unittest.mock
 
 import pytest
@@ -566,3 +567,69 @@ def test_retry_until_successful():
     test_run(0.02)
 
     test_run(mlrun.utils.create_linear_backoff(0.02, 0.02))
+
+
+def test_calculate_local_file_hash(tmp_path):
+    data = b"some artifact content" * 100000
+    file_path = tmp_path / "artifact.bin"
+    file_path.write_bytes(data)
+
+    # sha1 hashes are not prefixed, for backwards compatibility with stored artifacts
+    sha1_hash = mlrun.utils.helpers.calculate_local_file_hash(
+        str(file_path), algorithm="sha1"
+    )
+    assert sha1_hash == hashlib.sha1(data).hexdigest()
+
+    file_hash = mlrun.utils.helpers.calculate_local_file_hash(str(file_path))
+    assert file_hash == f"blake2b:{hashlib.blake2b(data, digest_size=32).hexdigest()}"
+
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        mlrun.utils.helpers.calculate_local_file_hash(str(file_path), algorithm="md4")
+
+    # small (and empty) files are read rather than memory mapped
+    for small_data in [b"", b"small artifact content"]:
+        file_path.write_bytes(small_data)
+        assert (
+            mlrun.utils.helpers.calculate_local_file_hash(
+                str(file_path), algorithm="sha256"
+            )
+            == f"sha256:{hashlib.sha256(small_data).hexdigest()}"
+        )
+
+
+def test_calculate_local_file_hash_without_mmap(tmp_path, monkeypatch):
+    data = b"some artifact content" * 100000
+    file_path = tmp_path / "artifact.bin"
+    file_path.write_bytes(data)
+
+    # files which can't be memory mapped are read instead
+    monkeypatch.setattr(
+        mlrun.utils.helpers.mmap,
+        "mmap",
+        unittest.mock.Mock(side_effect=OSError("mmap not supported")),
+    )
+    assert (
+        mlrun.utils.helpers.calculate_local_file_hash(
+            str(file_path), algorithm="sha256"
+        )
+        == f"sha256:{hashlib.sha256(data).hexdigest()}"
+    )
+    mlrun.utils.helpers.mmap.mmap.assert_called_once()
+
+
+@pytest.mark.parametrize("algorithm", ["blake3", "xxh3"])
+def test_optional_hash_falls_back_to_blake2b(tmp_path, monkeypatch, algorithm):
+    data = b"some artifact content"
+    file_path = tmp_path / "artifact.bin"
+    file_path.write_bytes(data)
+
+    monkeypatch.setattr(
+        mlrun.utils.helpers,
+        "_installed_hash_packages",
+        {"blake3": False, "xxhash": False},
+    )
+    assert mlrun.utils.helpers.resolve_hash_algorithm(algorithm) == "blake2b"
+    file_hash = mlrun.utils.helpers.calculate_local_file_hash(
+        str(file_path), algorithm=algorithm
+    )
+    assert file_hash == f"blake2b:{hashlib.blake2b(data, digest_size=32).hexdigest()}"